@@ -25,7 +25,7 @@ WHERE status = 'active'
 ORDER BY cycle_number DESC, id DESC;
 
 -- Expected: Should see 0 or 1 active round
--- If > 1: The new code will auto-fix on next request, but you can manually fix now
+-- If > 1: POST /api/admin/reconcile-active-rounds (or `flask reconcile-active-rounds`) fixes this, or fix manually below
 
 -- STEP 2: Identify the CORRECT active round (highest cycle)
 -- ==========================================================
@@ -141,4 +141,4 @@ WHERE created_at > NOW() - INTERVAL '7 days';
 -- Expected results:
 -- - Active Rounds: 0 or 1
 -- - Cycles with Active Rounds: 0 or 1
--- - If > 1: The app will auto-fix, or run STEP 3 manually
+-- - If > 1: POST /api/admin/reconcile-active-rounds, or run STEP 3 manually
@@ -1,9 +1,16 @@
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
+# Shared HTTP session so repeated API calls reuse pooled keep-alive connections.
+# Every request goes to the one football-data.org host, so a single host pool
+# holding up to 10 connections (one per concurrent request thread) is enough.
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
 class FootballDataAPI:
     def __init__(self):
         self.api_token = os.environ.get('FOOTBALL_API_TOKEN', 'fffc0c77c6d24545958210fcec5f4f03')
@@ -43,14 +50,14 @@ class FootballDataAPI:
             # Add a small delay to avoid rate limiting
             time.sleep(0.1)
             
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = _http_session.get(url, headers=self.headers, params=params, timeout=10)
             
             print(f"API Response Status: {response.status_code}")
             
             if response.status_code == 429:
                 print("Rate limit hit, waiting 60 seconds...")
                 time.sleep(60)
-                response = requests.get(url, headers=self.headers, params=params, timeout=10)
+                response = _http_session.get(url, headers=self.headers, params=params, timeout=10)
             
             if response.status_code == 403:
                 print("API Error: 403 Forbidden - Check your API token and subscription")
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.orm import joinedload
 import secrets
 import string
 
@@ -18,6 +19,11 @@ class Player(db.Model):
     last_entry_fee_paid_at = db.Column(db.Date, nullable=True)
 
     picks = db.relationship('Pick', backref='player', lazy=True)
+
+    # Player names are unique; duplicates surface as IntegrityError on commit
+    __table_args__ = (
+        db.Index('uq_players_name', 'name', unique=True),
+    )
     
     def __repr__(self):
         return f'<Player {self.name}>'
@@ -38,6 +44,14 @@ class Round(db.Model):
     
     fixtures = db.relationship('Fixture', backref='round', lazy=True)
     picks = db.relationship('Pick', backref='round', lazy=True)
+
+    # Serves get_current_active_round(): status filter ordered by newest cycle/id.
+    # ix_rounds_cycle_number lets the distinct-cycles listing and per-cycle lookups
+    # be answered from the index alone.
+    __table_args__ = (
+        db.Index('ix_round_status_cycle', 'status', cycle_number.desc(), id.desc()),
+        db.Index('ix_rounds_cycle_number', 'cycle_number'),
+    )
     
     def __repr__(self):
         return f'<Round {self.round_number} (PL MD {self.pl_matchday})>'
@@ -76,6 +90,14 @@ class Pick(db.Model):
     auto_reason = db.Column(db.String(50), nullable=True)  # missed_deadline, postponement_early, postponement_late, etc.
     postponed_event_id = db.Column(db.String(50), nullable=True)
     announcement_time = db.Column(db.DateTime, nullable=True)
+
+    # Composite indexes for the hot pick lookups: per player (optionally by round),
+    # per round (optionally by player) and per round by result
+    __table_args__ = (
+        db.Index('ix_pick_player_round', 'player_id', 'round_id'),
+        db.Index('ix_pick_round_player', 'round_id', 'player_id'),
+        db.Index('ix_pick_round_winner', 'round_id', 'is_winner'),
+    )
     
     def __repr__(self):
         return f'<Pick {self.player.name} - {self.team_picked}>'
@@ -96,6 +118,11 @@ class PickToken(db.Model):
     # Relationships
     player = db.relationship('Player', backref='pick_tokens', lazy=True)
     round = db.relationship('Round', backref='pick_tokens', lazy=True)
+
+    # Per-player token lookups and deletes
+    __table_args__ = (
+        db.Index('ix_picktoken_player', 'player_id'),
+    )
     
     def __repr__(self):
         return f'<PickToken {self.token[:8]}... for {self.player.name if self.player else "Unknown"}>'
@@ -123,26 +150,31 @@ class PickToken(db.Model):
 
         # Determine expiry from round deadline when present
         round_obj = Round.query.get(round_id)
-        expires_at = None
-        if round_obj and round_obj.end_date:
-            # Use the round deadline; if it's in the past, fall back to expires_hours window
-            if round_obj.end_date > datetime.utcnow():
-                expires_at = round_obj.end_date
-            elif expires_hours:
-                expires_at = datetime.utcnow() + timedelta(hours=expires_hours)
-        elif expires_hours:
-            expires_at = datetime.utcnow() + timedelta(hours=expires_hours)
 
         # Create new token
         token = PickToken(
             player_id=player_id,
             round_id=round_id,
             token=PickToken.generate_token(),
-            expires_at=expires_at
+            expires_at=PickToken.expiry_for_round(round_obj, expires_hours)
         )
 
         db.session.add(token)
         return token
+
+    @staticmethod
+    def expiry_for_round(round_obj, expires_hours=168):
+        """Expiry for a new token: the round deadline, or an expires_hours window when
+        the round has no deadline or it has already passed."""
+        if round_obj and round_obj.end_date:
+            # Use the round deadline; if it's in the past, fall back to expires_hours window
+            if round_obj.end_date > datetime.utcnow():
+                return round_obj.end_date
+            elif expires_hours:
+                return datetime.utcnow() + timedelta(hours=expires_hours)
+        elif expires_hours:
+            return datetime.utcnow() + timedelta(hours=expires_hours)
+        return None
     
     def is_valid(self):
         """Check if token is valid (not exceeded edit limit and not expired)"""
@@ -206,6 +238,11 @@ class ReminderSchedule(db.Model):
     # Relationships
     player = db.relationship('Player', backref='reminder_schedules')
     round = db.relationship('Round', backref='reminder_schedules')
+
+    # Per-player reminder lookups and deletes
+    __table_args__ = (
+        db.Index('ix_reminder_schedule_player', 'player_id'),
+    )
     
     def __repr__(self):
         return f'<ReminderSchedule {self.reminder_type} for {self.player.name} R{self.round.round_number}>'
@@ -287,8 +324,11 @@ class ReminderSchedule(db.Model):
     
     @staticmethod
     def get_pending_reminders():
-        """Get all reminders that are due and haven't been sent"""
-        return ReminderSchedule.query.filter(
+        """Get all reminders that are due and haven't been sent (player and round eager-loaded)"""
+        return ReminderSchedule.query.options(
+            joinedload(ReminderSchedule.player),
+            joinedload(ReminderSchedule.round)
+        ).filter(
             ReminderSchedule.is_sent == False,
             ReminderSchedule.scheduled_time <= datetime.utcnow()
         ).all()
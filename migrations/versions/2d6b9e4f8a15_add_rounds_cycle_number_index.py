@@ -0,0 +1,33 @@
+"""Add index on rounds.cycle_number
+
+Revision ID: 2d6b9e4f8a15
+Revises: 5c8a2f71d0e3
+Create Date: 2026-10-15 14:05:12.318406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d6b9e4f8a15'
+down_revision = '5c8a2f71d0e3'
+branch_labels = None
+depends_on = None
+
+
+def _has_index(table, name):
+    # The app's startup schema fallback (_ensure_minimum_schema) may already
+    # have created the index before `flask db upgrade` runs
+    return any(ix['name'] == name for ix in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade():
+    if not _has_index('rounds', 'ix_rounds_cycle_number'):
+        with op.batch_alter_table('rounds', schema=None) as batch_op:
+            batch_op.create_index('ix_rounds_cycle_number', ['cycle_number'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('rounds', schema=None) as batch_op:
+        batch_op.drop_index('ix_rounds_cycle_number')
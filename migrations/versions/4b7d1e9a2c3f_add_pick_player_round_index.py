@@ -0,0 +1,33 @@
+"""Add composite index on picks (player_id, round_id)
+
+Revision ID: 4b7d1e9a2c3f
+Revises: c16973330891
+Create Date: 2026-10-15 09:12:04.118274
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7d1e9a2c3f'
+down_revision = 'c16973330891'
+branch_labels = None
+depends_on = None
+
+
+def _has_index(table, name):
+    # The app's startup schema fallback (_ensure_minimum_schema) may already
+    # have created the index before `flask db upgrade` runs
+    return any(ix['name'] == name for ix in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade():
+    if not _has_index('picks', 'ix_pick_player_round'):
+        with op.batch_alter_table('picks', schema=None) as batch_op:
+            batch_op.create_index('ix_pick_player_round', ['player_id', 'round_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('picks', schema=None) as batch_op:
+        batch_op.drop_index('ix_pick_player_round')
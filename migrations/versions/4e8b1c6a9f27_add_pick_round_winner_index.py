@@ -0,0 +1,33 @@
+"""Add (round_id, is_winner) index on picks
+
+Revision ID: 4e8b1c6a9f27
+Revises: 7a3c5e9d1b86
+Create Date: 2026-10-15 23:12:41.527390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e8b1c6a9f27'
+down_revision = '7a3c5e9d1b86'
+branch_labels = None
+depends_on = None
+
+
+def _has_index(table, name):
+    # The app's startup schema fallback (_ensure_minimum_schema) may already
+    # have created the index before `flask db upgrade` runs
+    return any(ix['name'] == name for ix in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade():
+    if not _has_index('picks', 'ix_pick_round_winner'):
+        with op.batch_alter_table('picks', schema=None) as batch_op:
+            batch_op.create_index('ix_pick_round_winner', ['round_id', 'is_winner'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('picks', schema=None) as batch_op:
+        batch_op.drop_index('ix_pick_round_winner')
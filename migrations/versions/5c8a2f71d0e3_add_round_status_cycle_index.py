@@ -0,0 +1,37 @@
+"""Add composite index on rounds (status, cycle_number DESC, id DESC)
+
+Revision ID: 5c8a2f71d0e3
+Revises: 9e3f6a1c7b24
+Create Date: 2026-10-15 11:20:37.540192
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c8a2f71d0e3'
+down_revision = '9e3f6a1c7b24'
+branch_labels = None
+depends_on = None
+
+
+def _has_index(table, name):
+    # The app's startup schema fallback (_ensure_minimum_schema) may already
+    # have created the index before `flask db upgrade` runs
+    return any(ix['name'] == name for ix in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade():
+    if not _has_index('rounds', 'ix_round_status_cycle'):
+        with op.batch_alter_table('rounds', schema=None) as batch_op:
+            batch_op.create_index(
+                'ix_round_status_cycle',
+                ['status', sa.text('cycle_number DESC'), sa.text('id DESC')],
+                unique=False,
+            )
+
+
+def downgrade():
+    with op.batch_alter_table('rounds', schema=None) as batch_op:
+        batch_op.drop_index('ix_round_status_cycle')
@@ -0,0 +1,47 @@
+"""Add (round_id, player_id) pick index and player_id indexes on pick_tokens/reminder_schedules
+
+Revision ID: 7a3c5e9d1b86
+Revises: 2d6b9e4f8a15
+Create Date: 2026-10-15 16:42:08.905173
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a3c5e9d1b86'
+down_revision = '2d6b9e4f8a15'
+branch_labels = None
+depends_on = None
+
+
+def _has_index(table, name):
+    # The app's startup schema fallback (_ensure_minimum_schema) may already
+    # have created the index before `flask db upgrade` runs
+    return any(ix['name'] == name for ix in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade():
+    if not _has_index('picks', 'ix_pick_round_player'):
+        with op.batch_alter_table('picks', schema=None) as batch_op:
+            batch_op.create_index('ix_pick_round_player', ['round_id', 'player_id'], unique=False)
+
+    if not _has_index('pick_tokens', 'ix_picktoken_player'):
+        with op.batch_alter_table('pick_tokens', schema=None) as batch_op:
+            batch_op.create_index('ix_picktoken_player', ['player_id'], unique=False)
+
+    if not _has_index('reminder_schedules', 'ix_reminder_schedule_player'):
+        with op.batch_alter_table('reminder_schedules', schema=None) as batch_op:
+            batch_op.create_index('ix_reminder_schedule_player', ['player_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('reminder_schedules', schema=None) as batch_op:
+        batch_op.drop_index('ix_reminder_schedule_player')
+
+    with op.batch_alter_table('pick_tokens', schema=None) as batch_op:
+        batch_op.drop_index('ix_picktoken_player')
+
+    with op.batch_alter_table('picks', schema=None) as batch_op:
+        batch_op.drop_index('ix_pick_round_player')
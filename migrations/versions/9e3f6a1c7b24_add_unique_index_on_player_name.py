@@ -0,0 +1,52 @@
+"""Add unique index on players.name
+
+Revision ID: 9e3f6a1c7b24
+Revises: 4b7d1e9a2c3f
+Create Date: 2026-10-15 10:03:51.602917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e3f6a1c7b24'
+down_revision = '4b7d1e9a2c3f'
+branch_labels = None
+depends_on = None
+
+
+def _has_index(table, name):
+    # The app's startup schema fallback (_ensure_minimum_schema) may already
+    # have created the index before `flask db upgrade` runs
+    return any(ix['name'] == name for ix in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def upgrade():
+    # Rename later duplicates ("Name (id)") so the index can be created
+    # without losing any player rows or their picks.
+    conn = op.get_bind()
+    players = sa.table('players', sa.column('id', sa.Integer), sa.column('name', sa.String))
+    dup_names = sa.select(players.c.name).group_by(players.c.name).having(sa.func.count() > 1)
+    rows = conn.execute(
+        sa.select(players.c.id, players.c.name)
+        .where(players.c.name.in_(dup_names))
+        .order_by(players.c.name, players.c.id)
+    ).all()
+    seen = set()
+    for player_id, name in rows:
+        if name not in seen:
+            seen.add(name)
+            continue
+        new_name = f'{name} ({player_id})'
+        print(f'Renaming duplicate player {player_id}: {name!r} -> {new_name!r}')
+        conn.execute(players.update().where(players.c.id == player_id).values(name=new_name))
+
+    if not _has_index('players', 'uq_players_name'):
+        with op.batch_alter_table('players', schema=None) as batch_op:
+            batch_op.create_index('uq_players_name', ['name'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('players', schema=None) as batch_op:
+        batch_op.drop_index('uq_players_name')